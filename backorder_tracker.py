@@ -16,22 +16,67 @@ import time
 import json
 import logging
 import logging.handlers
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional
 import sqlite3
-from dataclasses import dataclass
 
-from mcp_integration import InteliquentOrderTracker, process_completed_order
+from mcp_integration import InteliquentOrderTracker, process_completed_order, update_zendesk_with_mcp_status
+# Safe at module scope: zendesk_webhook -> main never imports back into
+# this module, so there is no import cycle to dodge
+from zendesk_webhook import post_zendesk_comment
+
+# Optional C-extension JSON encoder - much faster than stdlib json for
+# pretty-printing carrier payloads, but not required to run
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _pretty_json(obj) -> str:
+    """Serialize a payload for human-readable notes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+class _LazyJSON:
+    """Defers JSON serialization until a log handler actually formats the record"""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return json.dumps(self.obj, default=str)
+
+# Resolved once at import: production containers mount /data, local runs
+# fall back to ./data. Both the log file and the DB live here, so the
+# prod/dev branch can't diverge between the two
+_DATA_DIR = "/data" if os.path.exists("/data") else "./data"
+os.makedirs(_DATA_DIR, exist_ok=True)
+
+class _CheapRolloverFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that skips the per-record rollover probe
+
+    The stock shouldRollover formats the record and stats the file on every
+    emit. While the stream is comfortably under the size limit the answer is
+    always no, so a tell() check answers it without either cost.
+    """
+
+    def shouldRollover(self, record):
+        if self.stream is not None and self.stream.tell() < self.maxBytes * 0.9:
+            return False
+        return super().shouldRollover(record)
 
 def setup_logging():
     """Setup optimized logging with rotation"""
-    log_dir = "/data" if os.path.exists("/data") else "./data"
-    os.makedirs(log_dir, exist_ok=True)
-    
     # Create rotating file handler (5MB max, keep 2 files)
-    log_file = os.path.join(log_dir, "backorder_tracker.log")
-    file_handler = logging.handlers.RotatingFileHandler(
+    log_file = os.path.join(_DATA_DIR, "backorder_tracker.log")
+    file_handler = _CheapRolloverFileHandler(
         log_file, 
         maxBytes=5*1024*1024,  # 5MB
         backupCount=2,
@@ -49,93 +94,348 @@ def setup_logging():
     
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
-    
+
+    # Route records through a queue so formatting and file/console I/O run
+    # on the listener's background thread, not the tracking thread
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+
     # Configure logger
     logger = logging.getLogger("backorder_tracker")
     logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
     return logger
 
 # Setup logging
 logger = setup_logging()
 
-@dataclass
+# Canonical SQL for the hot paths - module-level constants keep the text
+# interned so sqlite3's per-connection statement cache gets a hit on reuse
+_SQL_INSERT_BACKORDER = '''
+    INSERT INTO backorders
+    (order_id, area_code, quantity, ticket_id, status, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(order_id) DO UPDATE SET
+        area_code = excluded.area_code,
+        quantity = excluded.quantity,
+        ticket_id = excluded.ticket_id,
+        updated_at = excluded.updated_at
+'''
+_SQL_UPDATE_STATUS = '''
+    UPDATE backorders
+    SET status = ?, updated_at = ?, completion_date = ?
+    WHERE order_id = ?
+      AND (status != ? OR (? IS NOT NULL AND completion_date IS NULL))
+'''
+_SQL_SELECT_PENDING = '''
+    SELECT order_id, area_code, quantity, ticket_id, status, created_at, updated_at, completion_date, last_zendesk_update
+    FROM backorders
+    WHERE status = 'pending'
+'''
+# created_at is epoch seconds, so this is a plain integer comparison that
+# rides the (status, created_at) partial index
+_SQL_SELECT_PENDING_AGED = _SQL_SELECT_PENDING + " AND created_at <= ?"
+_SQL_SELECT_STATUS = 'SELECT status FROM backorders WHERE order_id = ?'
+_SQL_COUNT_PENDING = "SELECT COUNT(*) FROM backorders WHERE status = 'pending'"
+_SQL_TOUCH_ZENDESK = 'UPDATE backorders SET last_zendesk_update = ? WHERE order_id = ?'
+_SQL_DELETE_BACKORDER = 'DELETE FROM backorders WHERE order_id = ?'
+_SQL_ARCHIVE_BACKORDER = '''
+    INSERT OR REPLACE INTO backorders_archive
+    SELECT order_id, ticket_id, area_code, quantity, created_at, status,
+           updated_at, completion_date, last_zendesk_update, ?
+    FROM backorders WHERE order_id = ?
+'''
+_SQL_PRUNE_ARCHIVE = 'DELETE FROM backorders_archive WHERE archived_at < ?'
+
+# Built once at import; format_map fills the per-note fields in a single pass
+# instead of rebuilding the boilerplate string each time
+_STATUS_NOTE_TEMPLATE = (
+    "🔄 Backorder Status Update - {timestamp}\n\n"
+    "Order ID: {order_id}\n"
+    "Area Code: {area_code}\n"
+    "Quantity: {quantity}\n"
+    "Current Status: {status}\n"
+    "Estimated Completion: {estimated}\n\n"
+    "{status_lines}"
+    "\nNext status check: {next_check}"
+)
+
+@lru_cache(maxsize=1024)
+def _parse_iq_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an Inteliquent date string, returning None when absent/garbled
+
+    Memoized: a pending order reports the same desiredDueDate tick after
+    tick, so repeat parses become a dict hit.
+    """
+    if not value or value == "unknown":
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return None
+
 class BackorderRecord:
-    """Data class for backorder records"""
-    order_id: str
-    area_code: str
-    quantity: int
-    ticket_id: str
-    status: str
-    created_at: datetime
-    updated_at: datetime
-    completion_date: Optional[datetime] = None
-    last_status: Optional[str] = None  # Track last known status for change detection
+    """Backorder row as loaded from the database
+
+    Uses __slots__ so the hundreds of records a sweep can materialize don't
+    each carry a __dict__ (the deploy image is Python 3.9, which predates
+    dataclass slots=True). Timestamps are Unix epoch seconds straight from
+    the INTEGER columns; the datetime properties exist for the rare
+    human-facing uses and construct on access.
+    """
+
+    __slots__ = ("order_id", "area_code", "quantity", "ticket_id", "status",
+                 "created_at_ts", "updated_at_ts", "completion_date_ts",
+                 "last_zendesk_update_ts", "estimated_completion")
+
+    def __init__(self, order_id: str, area_code: str, quantity: int, ticket_id: str,
+                 status: str, created_at_ts: int, updated_at_ts: int,
+                 completion_date_ts: Optional[int] = None,
+                 last_zendesk_update_ts: Optional[int] = None):
+        self.order_id = order_id
+        self.area_code = area_code
+        self.quantity = quantity
+        self.ticket_id = ticket_id
+        self.status = status
+        self.created_at_ts = created_at_ts
+        self.updated_at_ts = updated_at_ts
+        self.completion_date_ts = completion_date_ts
+        self.last_zendesk_update_ts = last_zendesk_update_ts
+        # Parsed once per tick from the API's desiredDueDate, then reused by
+        # every note built for this record
+        self.estimated_completion: Optional[datetime] = None
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ts)
+
+    @property
+    def updated_at(self) -> datetime:
+        return datetime.fromtimestamp(self.updated_at_ts)
+
+    @property
+    def completion_date(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.completion_date_ts) if self.completion_date_ts else None
+
+    @property
+    def last_zendesk_update(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.last_zendesk_update_ts) if self.last_zendesk_update_ts else None
 
 class BackorderTracker:
     """Background tracker for Inteliquent backorders"""
     
     def __init__(self, db_path: str = None):
-        # Use absolute path by default, fallback to relative for local development
+        # Default to the module-level data dir (production /data mount or
+        # local ./data, resolved once at import)
         if db_path is None:
-            # Try production path first, fallback to local
-            if os.path.exists("/data"):
-                db_path = "/data/backorders.db"
-            else:
-                # Create local data directory if it doesn't exist
-                os.makedirs("data", exist_ok=True)
-                db_path = "data/backorders.db"
-        
+            db_path = os.path.join(_DATA_DIR, "backorders.db")
+
         self.db_path = db_path
         self.tracker = InteliquentOrderTracker()
         self.running = False
         self.track_thread = None
         self.last_status_log = 0  # Track when we last logged status
-        
+        self._wake = threading.Event()  # Set to interrupt the tracking sleep
+        self._last_status: Dict[str, str] = {}  # Last seen status per order, for change detection
+
+        # Hash of the last-posted note content for each order, so an unchanged
+        # 4-hourly update doesn't burn a rate-limited Zendesk call. Capped
+        # OrderedDict = cheap LRU
+        self._last_note_hash: "OrderedDict[str, int]" = OrderedDict()
+
+        # Short-TTL cache of check_order_status responses, so fallback
+        # fetches inside the same tick don't repeat the HTTP round-trip
+        self._status_cache: Dict[str, tuple] = {}  # order_id -> (fetched_at, result)
+
+        # Zendesk notes are fire-and-forget - push them through a queue so
+        # the tracking loop never blocks on Zendesk HTTP latency
+        self._zendesk_q: queue.Queue = queue.Queue()
+        self._zendesk_worker = None
+
+        # Reused across ticks so worker threads aren't torn down and
+        # respawned every cycle
+        self._api_pool = ThreadPoolExecutor(max_workers=8)
+
+        # Single long-lived connection shared by the tracking thread and
+        # webhook callers (serialized by _db_lock) - avoids paying the
+        # connect/close overhead on every DB call
+        # cached_statements keeps the prepared programs for the module-level
+        # SQL constants alive across calls instead of re-parsing
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                     cached_statements=256)
+        self._conn.row_factory = sqlite3.Row  # Name-based column access (C-implemented)
+        self._db_lock = threading.Lock()
+
+        # One-time connection tuning: WAL allows concurrent readers during
+        # writes, busy_timeout avoids immediate "database is locked" errors
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+        self._conn.execute("PRAGMA wal_autocheckpoint=1000")  # Keep the -wal file bounded
+        self._conn.execute("PRAGMA mmap_size=67108864")  # Memory-map up to 64MB of the DB file
+
         # Initialize database
         self.init_db()
-    
+
     def init_db(self):
         """Initialize the backorder tracking database"""
+        create_sql = '''
+            CREATE TABLE IF NOT EXISTS backorders (
+                order_id TEXT PRIMARY KEY,
+                ticket_id TEXT,
+                area_code TEXT,
+                quantity INTEGER,
+                created_at INTEGER,
+                status TEXT DEFAULT 'pending',
+                updated_at INTEGER,
+                completion_date INTEGER,
+                last_zendesk_update INTEGER
+            )
+        '''
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS backorders (
-                    order_id TEXT PRIMARY KEY,
-                    ticket_id TEXT,
-                    area_code TEXT,
-                    quantity INTEGER,
-                    created_at TEXT,
-                    status TEXT DEFAULT 'pending',
-                    updated_at TEXT,
-                    completion_date TEXT
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
+            with self._db_lock:
+                # Cheap existence probe first - on an already-initialized DB
+                # this skips the CREATE parsing and the ANALYZE pass entirely
+                table_exists = self._conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'backorders'"
+                ).fetchone() is not None
+                index_exists = self._conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_backorders_pending'"
+                ).fetchone() is not None
+                archive_exists = self._conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'backorders_archive'"
+                ).fetchone() is not None
+
+                if table_exists:
+                    # One-time migrations for DBs created before the Zendesk
+                    # cadence column and the epoch timestamp layout
+                    info = {row["name"]: (row["type"] or "").upper()
+                            for row in self._conn.execute("PRAGMA table_info(backorders)")}
+                    needs_column = "last_zendesk_update" not in info
+                    needs_epoch = info.get("created_at") != "INTEGER"
+
+                    if not needs_column and not needs_epoch and index_exists and archive_exists:
+                        logger.info("✅ Backorder database already initialized")
+                        return
+
+                    if needs_column:
+                        self._conn.execute("ALTER TABLE backorders ADD COLUMN last_zendesk_update TEXT")
+                        logger.info("📝 Added last_zendesk_update column to backorders")
+
+                    if needs_epoch:
+                        # ALTER can't change a column's affinity, so rebuild the
+                        # table with INTEGER timestamps and convert the ISO text
+                        # in SQL (strftime('%s', NULL) stays NULL)
+                        self._conn.execute("BEGIN IMMEDIATE")
+                        try:
+                            self._conn.execute(create_sql.replace(
+                                "IF NOT EXISTS backorders", "backorders_migrated"))
+                            self._conn.execute('''
+                                INSERT INTO backorders_migrated
+                                SELECT order_id, ticket_id, area_code, quantity,
+                                       CAST(strftime('%s', created_at) AS INTEGER),
+                                       status,
+                                       CAST(strftime('%s', updated_at) AS INTEGER),
+                                       CAST(strftime('%s', completion_date) AS INTEGER),
+                                       CAST(strftime('%s', last_zendesk_update) AS INTEGER)
+                                FROM backorders
+                            ''')
+                            self._conn.execute("DROP TABLE backorders")
+                            self._conn.execute("ALTER TABLE backorders_migrated RENAME TO backorders")
+                            self._conn.execute("COMMIT")
+                        except Exception:
+                            self._conn.execute("ROLLBACK")
+                            raise
+                        index_exists = False  # Dropped with the old table
+                        logger.info("📝 Migrated backorder timestamps to epoch integers")
+
+                if not table_exists:
+                    self._conn.execute(create_sql)
+
+                if not archive_exists:
+                    # Completed rows move here instead of lingering in (or
+                    # vanishing from) the hot table, keeping the working set
+                    # small while preserving history for support lookups
+                    self._conn.execute('''
+                        CREATE TABLE IF NOT EXISTS backorders_archive (
+                            order_id TEXT PRIMARY KEY,
+                            ticket_id TEXT,
+                            area_code TEXT,
+                            quantity INTEGER,
+                            created_at INTEGER,
+                            status TEXT,
+                            updated_at INTEGER,
+                            completion_date INTEGER,
+                            last_zendesk_update INTEGER,
+                            archived_at INTEGER
+                        )
+                    ''')
+
+                if not index_exists:
+                    # Partial index keeps get_pending_backorders an index seek
+                    # even as completed history accumulates - only the small
+                    # set of pending rows is indexed. created_at is included
+                    # so an age predicate can ride the same index scan
+                    self._conn.execute("DROP INDEX IF EXISTS idx_backorders_status")
+                    self._conn.execute('''
+                        CREATE INDEX IF NOT EXISTS idx_backorders_pending
+                        ON backorders(status, created_at) WHERE status = 'pending'
+                    ''')
+
+                # Refresh planner statistics so the index is actually used
+                self._conn.execute("ANALYZE")
             logger.info("✅ Backorder database initialized")
-            
+
+        except sqlite3.Error as e:
+            logger.error("❌ Failed to initialize backorder database: %s", e)
+
+    def _exec_retry(self, sql, params=(), tries=5):
+        """Execute a statement, retrying transient 'database is locked' errors
+
+        busy_timeout is the first line of defense; this backoff covers the
+        rare case where the timeout itself expires under contention.
+        """
+        for attempt in range(tries):
+            try:
+                with self._db_lock:
+                    return self._conn.execute(sql, params)
+            except sqlite3.OperationalError as e:
+                message = str(e).lower()
+                if ("locked" in message or "busy" in message) and attempt < tries - 1:
+                    time.sleep(0.01 * (2 ** attempt))
+                    continue
+                raise
+
+    @contextmanager
+    def _txn(self):
+        """Group several statements into one transaction (single fsync)"""
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        """Close the shared database connection"""
+        try:
+            with self._db_lock:
+                self._conn.close()
         except Exception as e:
-            logger.error(f"❌ Failed to initialize backorder database: {e}")
+            logger.error("❌ Failed to close backorder database: %s", e)
     
     def add_backorder(self, order_id: str, area_code: str, quantity: int, ticket_id: str = None):
         """Add a new backorder to tracking"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            current_time = datetime.now().isoformat()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO backorders 
-                (order_id, area_code, quantity, ticket_id, status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            current_time = int(time.time())
+
+            self._exec_retry(_SQL_INSERT_BACKORDER, (
                 order_id,
                 area_code,
                 quantity,
@@ -144,156 +444,238 @@ class BackorderTracker:
                 current_time,
                 current_time
             ))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"📝 Added backorder {order_id} to tracking")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to add backorder to tracking: {e}")
-    
-    def update_backorder_status(self, order_id: str, status: str, completion_date: Optional[datetime] = None):
-        """Update backorder status"""
+
+            logger.info("📝 Added backorder %s to tracking", order_id)
+
+            # Wake the tracking loop so the new order is checked immediately
+            self.poke()
+
+        except sqlite3.Error as e:
+            logger.error("❌ Failed to add backorder to tracking: %s", e)
+
+    def add_backorders(self, orders: List[tuple]):
+        """Add a batch of backorders in one transaction
+
+        `orders` is an iterable of (order_id, area_code, quantity,
+        ticket_id) tuples. The whole batch shares one prepared statement
+        and one fsync - use this over repeated add_backorder calls when
+        bulk-loading (e.g. re-registering orders after a restart).
+        """
+        orders = list(orders)
+        if not orders:
+            return
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            current_time = datetime.now().isoformat()
-            completion_date_str = completion_date.isoformat() if completion_date else None
-            
-            cursor.execute('''
-                UPDATE backorders 
-                SET status = ?, updated_at = ?, completion_date = ?
-                WHERE order_id = ?
-            ''', (status, current_time, completion_date_str, order_id))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"📝 Updated backorder {order_id} status to {status}")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to update backorder status: {e}")
+            now_ts = int(time.time())
+            rows = [(order_id, area_code, quantity, ticket_id, "pending", now_ts, now_ts)
+                    for order_id, area_code, quantity, ticket_id in orders]
+
+            with self._txn() as conn:
+                conn.executemany(_SQL_INSERT_BACKORDER, rows)
+
+            logger.info("📝 Added %s backorders to tracking", len(rows))
+            self.poke()
+
+        except sqlite3.Error as e:
+            logger.error("❌ Failed to add backorder batch: %s", e)
+
+    def poke(self):
+        """Wake the tracking loop before its sleep interval expires"""
+        self._wake.set()
     
-    def get_pending_backorders(self) -> List[BackorderRecord]:
-        """Get all pending backorders (excludes completed ones)"""
+    def update_backorder_status(self, order_id: str, status: str, completion_date: Optional[datetime] = None, now: Optional[datetime] = None, conn: Optional[sqlite3.Connection] = None):
+        """Update backorder status
+
+        Pass `conn` (from an open _txn block) to join an existing transaction
+        instead of committing standalone.
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT order_id, area_code, quantity, ticket_id, status, created_at, updated_at, completion_date
-                FROM backorders 
-                WHERE status = 'pending'
-            ''')
-            
-            records = []
-            for row in cursor.fetchall():
-                completion_date = datetime.fromisoformat(row[7]) if row[7] else None
-                
-                record = BackorderRecord(
-                    order_id=row[0],
-                    area_code=row[1],
-                    quantity=row[2],
-                    ticket_id=row[3],
-                    status=row[4],
-                    created_at=datetime.fromisoformat(row[5]),
-                    updated_at=datetime.fromisoformat(row[6]),
-                    completion_date=completion_date,
-                    last_status=None  # Will be set during tracking
+            current_ts = int((now or datetime.now()).timestamp())
+            completion_ts = int(completion_date.timestamp()) if completion_date else None
+
+            # The WHERE guard makes a same-status call a no-op so SQLite
+            # doesn't dirty a page (and fsync) for unchanged rows
+            params = (status, current_ts, completion_ts, order_id, status, completion_ts)
+            if conn is not None:
+                cursor = conn.execute(_SQL_UPDATE_STATUS, params)
+            else:
+                cursor = self._exec_retry(_SQL_UPDATE_STATUS, params)
+
+            if cursor.rowcount:
+                logger.info("📝 Updated backorder %s status to %s", order_id, status)
+
+        except sqlite3.Error as e:
+            logger.error("❌ Failed to update backorder status: %s", e)
+    
+    def iter_pending_backorders(self, min_age_hours: Optional[int] = None,
+                                batch_size: int = 256):
+        """Yield pending backorders in fetchmany batches
+
+        Streams records instead of materializing the whole result set, so
+        peak memory stays bounded even if a carrier outage piles up
+        thousands of pending rows. The DB lock is held only while a batch
+        is fetched, never across the caller's processing of it.
+        """
+        if min_age_hours is not None:
+            cutoff = int(time.time()) - min_age_hours * 3600
+            query, params = _SQL_SELECT_PENDING_AGED, (cutoff,)
+        else:
+            query, params = _SQL_SELECT_PENDING, ()
+
+        with self._db_lock:
+            cursor = self._conn.execute(query, params)
+
+        while True:
+            with self._db_lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            # Named access is robust to column reordering in the SELECT
+            for row in rows:
+                yield BackorderRecord(
+                    order_id=row["order_id"],
+                    area_code=row["area_code"],
+                    quantity=row["quantity"],
+                    ticket_id=row["ticket_id"],
+                    status=row["status"],
+                    created_at_ts=row["created_at"],
+                    updated_at_ts=row["updated_at"],
+                    completion_date_ts=row["completion_date"],
+                    last_zendesk_update_ts=row["last_zendesk_update"]
                 )
-                records.append(record)
-            
-            conn.close()
-            
-            # Filter out any backorders that might have been completed but not yet removed
-            active_records = [record for record in records if not self.is_backorder_completed(record.order_id)]
-            
-            if len(active_records) != len(records):
-                logger.info(f"🔍 Filtered out {len(records) - len(active_records)} completed backorders from tracking")
-            
-            return active_records
-            
+
+    def count_pending(self) -> int:
+        """Count pending backorders without materializing any records
+
+        An index-only COUNT on the pending partial index - used by the
+        tracking loop to skip a tick's setup when there is nothing to do.
+        """
+        try:
+            with self._db_lock:
+                return self._conn.execute(_SQL_COUNT_PENDING).fetchone()[0]
+
+        except sqlite3.Error as e:
+            logger.error("❌ Failed to count pending backorders: %s", e)
+            return 0
+
+    def get_pending_backorders(self, min_age_hours: Optional[int] = None) -> List[BackorderRecord]:
+        """Get all pending backorders (excludes completed ones)
+
+        When `min_age_hours` is given, rows younger than that are filtered
+        out in SQL rather than materialized and discarded in Python. The
+        tracking loop passes nothing - it deliberately checks every pending
+        order each tick.
+        """
+        try:
+            # The WHERE clause already excludes completed rows, so no
+            # per-row is_backorder_completed() re-check is needed here
+            return list(self.iter_pending_backorders(min_age_hours))
+
         except Exception as e:
-            logger.error(f"❌ Failed to get pending backorders: {e}")
+            logger.error("❌ Failed to get pending backorders: %s", e)
             return []
     
-    def create_backorder_status_note(self, backorder: BackorderRecord, status_result: dict) -> str:
+    @staticmethod
+    def _extract_completed_numbers(order_detail: dict) -> List[str]:
+        """Extract completed telephone numbers from an order detail payload"""
+        tn_list = order_detail.get("tnList", {}).get("tnItem", [])
+        return [
+            tn_item.get("tn", "")
+            for tn_item in tn_list
+            if tn_item.get("tnStatus") == "Complete"
+        ]
+
+    def create_backorder_status_note(self, backorder: BackorderRecord, status_result: dict, now: Optional[datetime] = None) -> str:
         """Create a status note for backorder tracking"""
         
         # Extract order details from Inteliquent response structure
         order_detail = status_result.get("orderDetailResponse", {})
         order_status = order_detail.get("orderStatus", "unknown")
-        desired_due_date = order_detail.get("desiredDueDate", "unknown")
-        
-        # Format the estimated completion date
-        try:
-            if desired_due_date != "unknown":
-                completion_date = datetime.fromisoformat(desired_due_date.replace('Z', '+00:00'))
-                formatted_date = completion_date.strftime("%Y-%m-%d %H:%M UTC")
-            else:
-                formatted_date = "TBD"
-        except:
-            formatted_date = "TBD"
-        
-        # Create the status note
-        note = f"🔄 Backorder Status Update - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        note += f"Order ID: {backorder.order_id}\n"
-        note += f"Area Code: {backorder.area_code}\n"
-        note += f"Quantity: {backorder.quantity}\n"
-        note += f"Current Status: {order_status.upper()}\n"
-        note += f"Estimated Completion: {formatted_date}\n\n"
-        
+
+        # The tracking loop parses desiredDueDate once per tick and stores it
+        # on the record; fall back to parsing here for callers outside the loop
+        completion_date = backorder.estimated_completion or _parse_iq_date(order_detail.get("desiredDueDate"))
+        formatted_date = completion_date.strftime("%Y-%m-%d %H:%M UTC") if completion_date else "TBD"
+
+
+        # Pick the status-specific lines up front so the note itself is a
+        # single f-string (one allocation instead of a chain of +=)
         if order_status == "Closed":
-            note += "✅ This backorder has been completed!\n"
-            note += "Processing numbers for inventory addition...\n"  # Changed: Don't claim MCP integration yet
+            status_lines = ("✅ This backorder has been completed!\n"
+                            "Processing numbers for inventory addition...\n")  # Changed: Don't claim MCP integration yet
         elif order_status == "pending":
-            note += "📋 This backorder is still being processed by our carrier.\n"
-            note += "We'll continue monitoring and update you when numbers become available.\n"
+            status_lines = ("📋 This backorder is still being processed by our carrier.\n"
+                            "We'll continue monitoring and update you when numbers become available.\n")
         else:
-            note += "⏳ Status is being monitored.\n"
-        
-        note += f"\nNext status check: {(datetime.now() + timedelta(hours=4)).strftime('%Y-%m-%d %H:%M:%S')}"
-        
-        return note
+            status_lines = "⏳ Status is being monitored.\n"
+
+        now = now or datetime.now()
+        return _STATUS_NOTE_TEMPLATE.format_map({
+            "timestamp": now.strftime('%Y-%m-%d %H:%M:%S'),
+            "order_id": backorder.order_id,
+            "area_code": backorder.area_code,
+            "quantity": backorder.quantity,
+            "status": order_status.upper(),
+            "estimated": formatted_date,
+            "status_lines": status_lines,
+            "next_check": (now + timedelta(hours=4)).strftime('%Y-%m-%d %H:%M:%S'),
+        })
+
+    def _ensure_zendesk_worker(self):
+        """Start the Zendesk posting worker if it isn't running yet"""
+        if self._zendesk_worker is None or not self._zendesk_worker.is_alive():
+            self._zendesk_worker = threading.Thread(target=self._zendesk_drain, daemon=True)
+            self._zendesk_worker.start()
+
+    def _zendesk_drain(self):
+        """Worker loop: post queued Zendesk comments off the tracking thread"""
+        while True:
+            item = self._zendesk_q.get()
+            if item is None:  # Shutdown sentinel
+                break
+
+            ticket_id, internal_comment, public_comment = item
+            try:
+                post_zendesk_comment(
+                    ticket_id=ticket_id,
+                    internal_comment=internal_comment,
+                    public_comment=public_comment
+                )
+            except Exception as e:
+                logger.error("❌ Failed to post queued Zendesk note for ticket %s: %s", ticket_id, e)
 
-    def post_backorder_status_note(self, backorder: BackorderRecord, status_result: dict):
+    def _enqueue_zendesk_note(self, ticket_id: str, internal_comment: str, public_comment: Optional[str] = None):
+        """Queue a Zendesk comment for the background worker"""
+        self._ensure_zendesk_worker()
+        self._zendesk_q.put((ticket_id, internal_comment, public_comment))
+
+    def post_backorder_status_note(self, backorder: BackorderRecord, status_result: dict, now: Optional[datetime] = None):
         """Post backorder status note to Zendesk ticket"""
         try:
-            from zendesk_webhook import post_zendesk_comment
-            
-            status_note = self.create_backorder_status_note(backorder, status_result)
-            
-            post_zendesk_comment(
-                ticket_id=backorder.ticket_id,
-                internal_comment=status_note,
-                public_comment=None  # Status notes are internal only
-            )
-            
-            logger.info(f"📝 Posted status note for backorder {backorder.order_id} to ticket {backorder.ticket_id}")
-            
+            status_note = self.create_backorder_status_note(backorder, status_result, now=now)
+
+            # Status notes are internal only
+            self._enqueue_zendesk_note(backorder.ticket_id, status_note)
+
+            logger.info("📝 Queued status note for backorder %s to ticket %s", backorder.order_id, backorder.ticket_id)
+
         except Exception as e:
-            logger.error(f"❌ Failed to post status note: {e}")
+            logger.error("❌ Failed to post status note: %s", e)
 
     def post_completion_note(self, backorder: BackorderRecord, status_result: dict):
         """Post completion note to Zendesk when backorder status changes to Closed"""
         try:
-            from zendesk_webhook import post_zendesk_comment
-            
             # Extract order details from Inteliquent response structure
             order_detail = status_result.get("orderDetailResponse", {})
             order_status = order_detail.get("orderStatus", "unknown")
             desired_due_date = order_detail.get("desiredDueDate", "unknown")
-            
+
             # Extract completed numbers from tnList
-            completed_numbers = []
-            tn_list = order_detail.get("tnList", {}).get("tnItem", [])
-            
-            for tn_item in tn_list:
-                if tn_item.get("tnStatus") == "Complete":
-                    completed_numbers.append(tn_item.get("tn", ""))
-            
+            completed_numbers = self._extract_completed_numbers(order_detail)
+
+            # Precompute the optional numbers line so the note below is built
+            # in a single f-string allocation
+            numbers_line = f"\n📱 Completed Numbers: {', '.join(completed_numbers)}" if completed_numbers else ""
+
             # Create comprehensive completion note
             completion_note = f"""
 🎉 BACKORDER COMPLETED - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -305,92 +687,95 @@ class BackorderTracker:
 📅 Desired Due Date: {desired_due_date if desired_due_date != "unknown" else "N/A"}
 
 📋 Inteliquent Response Details:
-{json.dumps(order_detail, indent=2, default=str)}
+{_pretty_json(order_detail)}
 
 🚫 STATUS: This backorder is now CLOSED and will no longer be monitored.
 📝 No further internal notes will be added for this order.
-            """
-            
-            # Add completed numbers if available
-            if completed_numbers:
-                completion_note += f"\n📱 Completed Numbers: {', '.join(completed_numbers)}"
-            
-            post_zendesk_comment(
-                ticket_id=backorder.ticket_id,
-                internal_comment=completion_note,
-                public_comment=None  # Completion notes are internal only
-            )
-            
-            logger.info(f"🎉 Posted completion note for backorder {backorder.order_id} to ticket {backorder.ticket_id}")
+            {numbers_line}"""
+
+            # Completion notes are internal only
+            self._enqueue_zendesk_note(backorder.ticket_id, completion_note)
+
+            logger.info("🎉 Queued completion note for backorder %s to ticket %s", backorder.order_id, backorder.ticket_id)
             
         except Exception as e:
-            logger.error(f"❌ Failed to post completion note: {e}")
+            logger.error("❌ Failed to post completion note: %s", e)
+
+    def _cached_check_order_status(self, order_id: str, ttl: float = 60.0) -> dict:
+        """check_order_status with a short TTL cache
+
+        Collapses repeated fetches for the same order within one tick (e.g.
+        a completion check followed by MCP processing) into a single HTTP
+        round-trip. Errors are never cached.
+        """
+        cached = self._status_cache.get(order_id)
+        if cached is not None and time.time() - cached[0] < ttl:
+            return cached[1]
 
-    def check_backorder_completion(self, backorder: BackorderRecord) -> bool:
+        result = self.tracker.check_order_status(order_id)
+        if "error" not in result:
+            self._status_cache[order_id] = (time.time(), result)
+        return result
+
+    def check_backorder_completion(self, backorder: BackorderRecord, status_result: dict = None) -> bool:
         """Check if a specific backorder is completed (detection only, no MCP processing)"""
         try:
-            # Check order status via Inteliquent API
-            status_result = self.tracker.check_order_status(backorder.order_id)
-            
+            # Reuse an already-fetched status when the caller has one;
+            # otherwise check order status via Inteliquent API
+            if status_result is None:
+                status_result = self._cached_check_order_status(backorder.order_id)
+
             if "error" in status_result:
-                logger.warning(f"⚠️ Error checking order {backorder.order_id}: {status_result['error']}")
+                logger.warning("⚠️ Error checking order %s: %s", backorder.order_id, status_result['error'])
                 return False
-            
+
             # Extract order details from Inteliquent response structure
             order_detail = status_result.get("orderDetailResponse", {})
             order_status = order_detail.get("orderStatus", "")
-            
-            logger.info(f"📋 Order {backorder.order_id} status: {order_status}")
-            
+
+            logger.info("📋 Order %s status: %s", backorder.order_id, order_status)
+
             # Check if order is completed (Inteliquent uses "Closed" status)
             if order_status == "Closed":
                 # Extract completed numbers from tnList
-                completed_numbers = []
-                tn_list = order_detail.get("tnList", {}).get("tnItem", [])
-                
-                for tn_item in tn_list:
-                    if tn_item.get("tnStatus") == "Complete":
-                        completed_numbers.append(tn_item.get("tn", ""))
-                
+                completed_numbers = self._extract_completed_numbers(order_detail)
+
                 if completed_numbers:
-                    logger.info(f"✅ Backorder {backorder.order_id} has {len(completed_numbers)} completed numbers")
+                    logger.info("✅ Backorder %s has %s completed numbers", backorder.order_id, len(completed_numbers))
                     return True
                 else:
-                    logger.warning(f"⚠️ Order {backorder.order_id} is closed but no completed numbers found")
+                    logger.warning("⚠️ Order %s is closed but no completed numbers found", backorder.order_id)
                     return True  # Still consider it completed even without numbers
             
             return False
             
         except Exception as e:
-            logger.error(f"❌ Exception checking backorder completion: {e}")
+            logger.error("❌ Exception checking backorder completion: %s", e)
             return False
 
-    def process_completed_backorder(self, backorder: BackorderRecord) -> bool:
+    def process_completed_backorder(self, backorder: BackorderRecord, status_result: dict = None) -> bool:
         """Process a completed backorder with MCP integration (separate from completion detection)"""
         try:
-            # Check order status via Inteliquent API
-            status_result = self.tracker.check_order_status(backorder.order_id)
-            
+            # Reuse an already-fetched status when the caller has one;
+            # otherwise check order status via Inteliquent API
+            if status_result is None:
+                status_result = self._cached_check_order_status(backorder.order_id)
+
             if "error" in status_result:
-                logger.warning(f"⚠️ Error checking order {backorder.order_id}: {status_result['error']}")
+                logger.warning("⚠️ Error checking order %s: %s", backorder.order_id, status_result['error'])
                 return False
-            
+
             # Extract order details from Inteliquent response structure
             order_detail = status_result.get("orderDetailResponse", {})
             order_status = order_detail.get("orderStatus", "")
-            
+
             if order_status != "Closed":
-                logger.warning(f"⚠️ Order {backorder.order_id} is not closed, cannot process")
+                logger.warning("⚠️ Order %s is not closed, cannot process", backorder.order_id)
                 return False
-            
+
             # Extract completed numbers from tnList
-            completed_numbers = []
-            tn_list = order_detail.get("tnList", {}).get("tnItem", [])
-            
-            for tn_item in tn_list:
-                if tn_item.get("tnStatus") == "Complete":
-                    completed_numbers.append(tn_item.get("tn", ""))
-            
+            completed_numbers = self._extract_completed_numbers(order_detail)
+
             if completed_numbers:
                 # Update database
                 self.update_backorder_status(
@@ -408,11 +793,10 @@ class BackorderTracker:
                 
                 # Check if MCP processing was successful (has successful_additions)
                 if process_result.get("successful_additions"):
-                    logger.info(f"✅ Successfully processed {len(process_result['successful_additions'])} numbers from backorder {backorder.order_id}")
+                    logger.info("✅ Successfully processed %s numbers from backorder %s", len(process_result['successful_additions']), backorder.order_id)
                     
                     # Update Zendesk ticket with MCP integration status
                     if backorder.ticket_id:
-                        from mcp_integration import update_zendesk_with_mcp_status
                         update_zendesk_with_mcp_status(
                             ticket_id=backorder.ticket_id,
                             mcp_result=process_result,
@@ -426,22 +810,20 @@ class BackorderTracker:
                             completed_numbers=completed_numbers
                         )
                 elif process_result.get("error"):
-                    logger.error(f"❌ Failed to process completed backorder {backorder.order_id}: {process_result.get('error')}")
+                    logger.error("❌ Failed to process completed backorder %s: %s", backorder.order_id, process_result.get('error'))
                     
                     # Post MCP failure note
                     if backorder.ticket_id:
-                        from mcp_integration import update_zendesk_with_mcp_status
                         update_zendesk_with_mcp_status(
                             ticket_id=backorder.ticket_id,
                             mcp_result=process_result,
                             numbers_added=[]
                         )
                 else:
-                    logger.warning(f"⚠️ No numbers were successfully processed for backorder {backorder.order_id}")
+                    logger.warning("⚠️ No numbers were successfully processed for backorder %s", backorder.order_id)
                     
                     # Post partial success note
                     if backorder.ticket_id:
-                        from mcp_integration import update_zendesk_with_mcp_status
                         update_zendesk_with_mcp_status(
                             ticket_id=backorder.ticket_id,
                             mcp_result=process_result,
@@ -450,19 +832,16 @@ class BackorderTracker:
                 
                 return True
             else:
-                logger.warning(f"⚠️ Order {backorder.order_id} is closed but no completed numbers found")
+                logger.warning("⚠️ Order %s is closed but no completed numbers found", backorder.order_id)
                 return False
             
         except Exception as e:
-            logger.error(f"❌ Exception processing completed backorder: {e}")
+            logger.error("❌ Exception processing completed backorder: %s", e)
             return False
     
     def update_zendesk_ticket(self, ticket_id: str, order_id: str, completed_numbers: List[str]):
         """Update Zendesk ticket with backorder completion"""
         try:
-            # Import here to avoid circular imports
-            from zendesk_webhook import post_zendesk_comment
-            
             message = f"✅ Inteliquent backorder {order_id} completed! {len(completed_numbers)} numbers have been added to inventory."
             internal_note = f"Backorder completion processed. Numbers: {', '.join(completed_numbers)}"
             
@@ -472,27 +851,42 @@ class BackorderTracker:
                 public_comment=message
             )
             
-            logger.info(f"📝 Updated Zendesk ticket {ticket_id} with backorder completion")
+            logger.info("📝 Updated Zendesk ticket %s with backorder completion", ticket_id)
             
         except Exception as e:
-            logger.error(f"❌ Failed to update Zendesk ticket: {e}")
+            logger.error("❌ Failed to update Zendesk ticket: %s", e)
     
-    def remove_completed_backorder(self, order_id: str):
-        """Remove a completed backorder from tracking"""
+    def remove_completed_backorder(self, order_id: str, conn: Optional[sqlite3.Connection] = None):
+        """Move a completed backorder out of tracking into the archive
+
+        Pass `conn` (from an open _txn block) to join an existing transaction
+        instead of committing standalone.
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                DELETE FROM backorders WHERE order_id = ?
-            ''', (order_id,))
-            
-            conn.commit()
-            conn.close()
-            logger.info(f"📝 Removed completed backorder {order_id} from tracking")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to remove completed backorder {order_id}: {e}")
+            now_ts = int(time.time())
+            if conn is not None:
+                conn.execute(_SQL_ARCHIVE_BACKORDER, (now_ts, order_id))
+                conn.execute(_SQL_DELETE_BACKORDER, (order_id,))
+            else:
+                with self._txn() as txn_conn:
+                    txn_conn.execute(_SQL_ARCHIVE_BACKORDER, (now_ts, order_id))
+                    txn_conn.execute(_SQL_DELETE_BACKORDER, (order_id,))
+
+            logger.info("📝 Archived completed backorder %s", order_id)
+
+        except sqlite3.Error as e:
+            logger.error("❌ Failed to remove completed backorder %s: %s", order_id, e)
+
+    def prune_archive(self, older_than_days: int = 90):
+        """Drop archived backorders older than the retention window"""
+        try:
+            cutoff = int(time.time()) - older_than_days * 86400
+            cursor = self._exec_retry(_SQL_PRUNE_ARCHIVE, (cutoff,))
+            if cursor.rowcount:
+                logger.info("🧹 Pruned %s archived backorders", cursor.rowcount)
+
+        except sqlite3.Error as e:
+            logger.error("❌ Failed to prune backorder archive: %s", e)
     
     def start_tracking(self):
         """Start background tracking of backorders"""
@@ -501,172 +895,236 @@ class BackorderTracker:
             return
         
         self.running = True
+        self._ensure_zendesk_worker()
         self.track_thread = threading.Thread(target=self._tracking_loop, daemon=True)
         self.track_thread.start()
         logger.info("🚀 Started backorder tracking")
-    
+
     def stop_tracking(self):
         """Stop background tracking"""
         self.running = False
+        self._wake.set()  # Interrupt the sleep so the thread exits promptly
         if self.track_thread:
             self.track_thread.join()
+        if self._zendesk_worker and self._zendesk_worker.is_alive():
+            self._zendesk_q.put(None)  # Sentinel: drain and exit
+            self._zendesk_worker.join()
+        self._api_pool.shutdown(wait=True)
+        self.close()
         logger.info("🛑 Stopped backorder tracking")
     
     def _tracking_loop(self):
         """Main tracking loop - Optimized for frequent checking with minimal logging"""
         check_count = 0
-        last_status_updates = {}  # Track last status update time per backorder
+        idle_wait = 600  # Doubles after each empty cycle, capped at an hour
         
         while self.running:
             try:
                 check_count += 1
-                
-                # Get pending backorders
-                pending_backorders = self.get_pending_backorders()
-                
+
+                # One timestamp per cycle - avoids re-calling datetime.now()
+                # for every backorder in the tick
+                cycle_now = datetime.now()
+
+                # Index-only COUNT first: on the common empty tick this skips
+                # building records (and the fetch query) entirely
+                pending_backorders = self.get_pending_backorders() if self.count_pending() else []
+
                 if pending_backorders:
+                    idle_wait = 600
+
                     # Only log summary every 60 checks (10 hours) to reduce log volume
                     if check_count % 60 == 0:
-                        logger.info(f"🔍 Monitoring {len(pending_backorders)} pending backorders")
+                        logger.info("🔍 Monitoring %s pending backorders", len(pending_backorders))
                     
-                    for backorder in pending_backorders:
+                    # Fetch all statuses concurrently - each check is a blocking
+                    # HTTP round-trip, so a serial loop costs N x RTT of wall time
+                    status_results = list(self._api_pool.map(
+                        lambda b: self._cached_check_order_status(b.order_id),
+                        pending_backorders
+                    ))
+
+                    # Process results serially so DB and Zendesk side effects
+                    # stay single-threaded
+                    completed_order_ids = []
+                    for backorder, status_result in zip(pending_backorders, status_results):
                         # Check ALL backorders regardless of age (frequent monitoring)
-                        current_time = datetime.now()
-                        
-                        # Get status from Inteliquent API (no logging for routine checks)
-                        status_result = self.tracker.check_order_status(backorder.order_id)
-                        
+                        current_time = cycle_now
+
                         if "error" not in status_result:
                             # Extract order details
                             order_detail = status_result.get("orderDetailResponse", {})
                             current_status = order_detail.get("orderStatus", "unknown")
+                            backorder.estimated_completion = _parse_iq_date(order_detail.get("desiredDueDate"))
+
+                            # Lazy wrapper: the payload is only serialized if
+                            # DEBUG logging is actually enabled
+                            logger.debug("📋 Order detail for %s: %s", backorder.order_id, _LazyJSON(order_detail))
                             
-                            # Check if status has changed
-                            status_changed = False
-                            if hasattr(backorder, 'last_status') and backorder.last_status != current_status:
-                                status_changed = True
-                                logger.info(f"🔄 Status change detected for backorder {backorder.order_id}: {backorder.last_status} → {current_status}")
-                                
+                            # Check if status has changed - the cache lives on the
+                            # tracker (records are rebuilt from the DB every cycle,
+                            # so storing it on BackorderRecord never survived a tick)
+                            prev_status = self._last_status.get(backorder.order_id)
+                            status_changed = prev_status is not None and prev_status != current_status
+                            if status_changed:
+                                logger.info("🔄 Status change detected for backorder %s: %s → %s", backorder.order_id, prev_status, current_status)
+
                                 # If status changed to "Closed", post completion note immediately
                                 if current_status == "Closed":
-                                    logger.info(f"🎉 Backorder {backorder.order_id} status changed to CLOSED - posting completion note")
+                                    logger.info("🎉 Backorder %s status changed to CLOSED - posting completion note", backorder.order_id)
                                     self.post_completion_note(backorder, status_result)
-                            
+
                             # Store current status for next comparison
-                            backorder.last_status = current_status
+                            self._last_status[backorder.order_id] = current_status
                             
                             # Check if completed
                             if current_status == "Closed":
-                                if self.check_backorder_completion(backorder):
-                                    logger.info(f"✅ Backorder {backorder.order_id} completed!")
-                                    
+                                if self.check_backorder_completion(backorder, status_result):
+                                    logger.info("✅ Backorder %s completed!", backorder.order_id)
+
                                     # Process the completion with MCP integration
-                                    if self.process_completed_backorder(backorder):
-                                        logger.info(f"✅ Successfully processed backorder {backorder.order_id} with MCP integration")
+                                    if self.process_completed_backorder(backorder, status_result):
+                                        logger.info("✅ Successfully processed backorder %s with MCP integration", backorder.order_id)
                                     else:
-                                        logger.warning(f"⚠️ Failed to process backorder {backorder.order_id} with MCP integration")
+                                        logger.warning("⚠️ Failed to process backorder %s with MCP integration", backorder.order_id)
                                     
                                     # CRITICAL FIX: Clear all timers immediately to prevent any further updates
-                                    self.clear_backorder_timers(backorder.order_id, last_status_updates)
-                                    
-                                    # Remove from tracking after completion
-                                    self.remove_completed_backorder(backorder.order_id)
+                                    self.clear_backorder_timers(backorder.order_id)
+
+                                    # Remove from tracking after completion (batched below)
+                                    completed_order_ids.append(backorder.order_id)
                                     # Continue to next backorder - don't process this one further
                                     continue
                                 else:
-                                    logger.warning(f"⚠️ Order {backorder.order_id} is closed but no completed numbers found")
-                                    # Even if no numbers, mark as completed to stop further processing
-                                    self.update_backorder_status(backorder.order_id, "completed", datetime.now())
-                                    
+                                    logger.warning("⚠️ Order %s is closed but no completed numbers found", backorder.order_id)
+
                                     # CRITICAL FIX: Clear all timers immediately to prevent any further updates
-                                    self.clear_backorder_timers(backorder.order_id, last_status_updates)
-                                    
-                                    self.remove_completed_backorder(backorder.order_id)
+                                    self.clear_backorder_timers(backorder.order_id)
+
+                                    # Even with no numbers, drop the row to stop further
+                                    # processing (batched below)
+                                    completed_order_ids.append(backorder.order_id)
                                     continue
                             
                             # Skip status updates for completed backorders
                             if self.is_backorder_completed(backorder.order_id):
-                                logger.info(f"⏭️ Skipping status update for completed backorder {backorder.order_id}")
+                                logger.info("⏭️ Skipping status update for completed backorder %s", backorder.order_id)
                                 continue
                             
                             # ADDITIONAL SAFETY: Skip status updates if we just detected completion
                             if current_status == "Closed":
-                                logger.info(f"⏭️ Skipping status update for backorder {backorder.order_id} - status is Closed, processing completion")
+                                logger.info("⏭️ Skipping status update for backorder %s - status is Closed, processing completion", backorder.order_id)
                                 continue
                             
-                            # Post status update to Zendesk every 4 hours (only for non-completed backorders)
-                            last_update = last_status_updates.get(backorder.order_id)
+                            # Post status update to Zendesk every 4 hours (only for
+                            # non-completed backorders). The timestamp lives in the
+                            # DB row, so a restart doesn't re-notify every ticket
+                            last_update_ts = backorder.last_zendesk_update_ts
                             should_update_ticket = (
-                                last_update is None or 
-                                (current_time - last_update).total_seconds() >= 14400  # 4 hours
+                                last_update_ts is None or
+                                time.time() - last_update_ts >= 14400  # 4 hours
                             )
-                            
+
                             if should_update_ticket:
-                                self.post_backorder_status_note(backorder, status_result)
-                                last_status_updates[backorder.order_id] = current_time
-                                logger.info(f"📝 Posted 4-hour status update for backorder {backorder.order_id}")
+                                # Skip the post if nothing the note reports has
+                                # changed since the last one; the hash check is
+                                # re-evaluated every tick, so the note goes out
+                                # the moment the payload actually changes
+                                note_hash = hash((current_status, order_detail.get("desiredDueDate")))
+                                if self._last_note_hash.get(backorder.order_id) != note_hash:
+                                    self.post_backorder_status_note(backorder, status_result, now=cycle_now)
+                                    self._exec_retry(_SQL_TOUCH_ZENDESK, (int(current_time.timestamp()), backorder.order_id))
+                                    self._last_note_hash[backorder.order_id] = note_hash
+                                    self._last_note_hash.move_to_end(backorder.order_id)
+                                    while len(self._last_note_hash) > 1024:
+                                        self._last_note_hash.popitem(last=False)
+                                    logger.info("📝 Posted 4-hour status update for backorder %s", backorder.order_id)
                             
                             # Log only on status changes (not routine checks)
                             if status_changed:
-                                logger.info(f"📊 Backorder {backorder.order_id} status: {current_status}")
+                                logger.info("📊 Backorder %s status: %s", backorder.order_id, current_status)
                                 
                         else:
                             # Only log API errors (important for debugging)
-                            logger.warning(f"⚠️ Error checking backorder {backorder.order_id}: {status_result['error']}")
+                            logger.warning("⚠️ Error checking backorder %s: %s", backorder.order_id, status_result['error'])
+
+                    # Flush all completion removals in one transaction (one
+                    # fsync): copy each row into the archive, drop it from
+                    # the hot table, and apply retention to the archive
+                    if completed_order_ids:
+                        now_ts = int(cycle_now.timestamp())
+                        with self._txn() as conn:
+                            conn.executemany(_SQL_ARCHIVE_BACKORDER, [(now_ts, oid) for oid in completed_order_ids])
+                            conn.executemany(_SQL_DELETE_BACKORDER, [(oid,) for oid in completed_order_ids])
+                        self.prune_archive()
+                        logger.info("📝 Archived %s completed backorders", len(completed_order_ids))
                 else:
+                    # Back off exponentially while idle - nothing can change
+                    # without an add_backorder call, and that pokes the loop
+                    # awake, which also resets the wait below
+                    idle_wait = min(3600, idle_wait * 2)
+
                     # Only log when no pending backorders every 60 checks (10 hours)
                     if check_count % 60 == 0:
                         logger.info("📋 No pending backorders to monitor")
-                
-                # Wait 10 minutes before next check (frequent monitoring)
-                time.sleep(600)  # 10 minutes
+
+                # Wait before the next check (10 minutes while active, longer
+                # when idle), waking early if poked or stopped
+                if self._wake.wait(idle_wait if not pending_backorders else 600):
+                    self._wake.clear()
+                    idle_wait = 600
                 
             except Exception as e:
-                logger.error(f"❌ Exception in tracking loop: {e}")
-                time.sleep(3600)  # Wait 1 hour on error
+                logger.error("❌ Exception in tracking loop: %s", e)
+                # Wait 1 hour on error, but stay interruptible for shutdown
+                if self._wake.wait(3600):
+                    self._wake.clear()
 
     def is_backorder_completed(self, order_id: str) -> bool:
         """Check if backorder is already completed"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT status FROM backorders WHERE order_id = ?
-            ''', (order_id,))
-            
-            result = cursor.fetchone()
-            conn.close()
-            
-            return result and result[0] == "completed"
-            
-        except Exception as e:
-            logger.error(f"❌ Error checking backorder completion status: {e}")
+            with self._db_lock:
+                result = self._conn.execute(_SQL_SELECT_STATUS, (order_id,)).fetchone()
+
+            return result and result["status"] == "completed"
+
+        except sqlite3.Error as e:
+            logger.error("❌ Error checking backorder completion status: %s", e)
             return False
 
-    def clear_backorder_timers(self, order_id: str, last_status_updates: dict):
-        """Clear all tracking timers for a completed backorder"""
+    def clear_backorder_timers(self, order_id: str):
+        """Clear all tracking timers for a completed backorder
+
+        The 4-hour cadence timestamp lives on the DB row and is deleted with
+        it, so only the in-memory caches need clearing here.
+        """
         try:
-            # Clear status update timer
-            if order_id in last_status_updates:
-                del last_status_updates[order_id]
-                logger.info(f"⏰ Cleared status update timer for completed backorder {order_id}")
+            # Drop the status-change and note-dedupe cache entries so the
+            # dicts don't grow forever
+            self._last_status.pop(order_id, None)
+            self._last_note_hash.pop(order_id, None)
+            self._status_cache.pop(order_id, None)
             
             # Clear any other timers that might be stored in the backorder object
             # This ensures no residual timing data remains
-            logger.info(f"🧹 Cleared all timers for completed backorder {order_id}")
+            logger.info("🧹 Cleared all timers for completed backorder %s", order_id)
             
         except Exception as e:
-            logger.error(f"❌ Error clearing timers for backorder {order_id}: {e}")
+            logger.error("❌ Error clearing timers for backorder %s: %s", order_id, e)
 
 # Global tracker instance
 backorder_tracker = None
+_tracker_lock = threading.Lock()
 
 def get_backorder_tracker() -> BackorderTracker:
     """Get or create the global backorder tracker"""
     global backorder_tracker
+    # Double-checked so concurrent first callers can't each construct a
+    # tracker (two DB connections + two polling threads)
     if backorder_tracker is None:
-        backorder_tracker = BackorderTracker()
+        with _tracker_lock:
+            if backorder_tracker is None:
+                backorder_tracker = BackorderTracker()
     return backorder_tracker
 
 def start_backorder_tracking():
@@ -711,7 +1169,7 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("🛑 Received keyboard interrupt")
     except Exception as e:
-        logger.error(f"❌ Backorder tracking error: {e}")
+        logger.error("❌ Backorder tracking error: %s", e)
         sys.exit(1)
     finally:
         logger.info("🛑 Shutting down backorder tracking...") 
\ No newline at end of file
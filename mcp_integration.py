@@ -393,6 +393,13 @@ class InteliquentOrderTracker:
             logger.error("❌ Missing Inteliquent credentials in environment variables")
             raise ValueError("Missing Inteliquent credentials")
 
+        # One session for all status polls so repeated calls reuse the same
+        # TCP/TLS connection instead of handshaking on every request
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def _get_headers(self):
         """Get headers for Inteliquent API requests"""
         # Encode credentials to Base64 for Basic Auth
@@ -419,7 +426,7 @@ class InteliquentOrderTracker:
             logger.info(f"🔍 Checking order status for order ID: {order_id}")
             logger.info(f"📤 Payload: {json.dumps(payload, indent=2)}")
             
-            response = requests.post(  # ✅ POST method as per API
+            response = self.session.post(  # ✅ POST method as per API
                 url,
                 json=payload,  # ✅ JSON payload
                 headers=self._get_headers(),